@@ -1,33 +1,51 @@
+import asyncio
 import os
 import json
 from dotenv import load_dotenv
 from mcp_meeting_assistant.models.gemini import Gemini
 
+# Use orjson for serialization when it is installed, falling back to json.
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def dumps(obj):
+        return json.dumps(obj, indent=2)
+
+
 # --- Setup ---
 load_dotenv()
 model = Gemini(model_name=os.getenv("GEMINI_MODEL", "gemini-1.5-flash"))
 messages = []
 
-# --- First Question ---
-print("------ First Question ------")
-question = "What is the capital of Germany?"
 
-text = model.ask(question, messages)
+async def main():
+    # --- First Question ---
+    print("------ First Question ------")
+    question = "What is the capital of Germany?"
+
+    text = await model.ask(question, messages)
 
-print("Question:", question)
-print("Response:", text)
+    print("Question:", question)
+    print("Response:", text)
 
+    # --- Second Question (With Conversational Context) ---
+    print("\n------ Second Question ------")
+    question = "What about for France?"
 
-# --- Second Question (With Conversational Context) ---
-print("\n------ Second Question ------")
-question = "What about for France?"
+    text = await model.ask(question, messages)
 
-text = model.ask(question, messages)
+    print("Question:", question)
+    print("Response:", text)
 
-print("Question:", question)
-print("Response:", text)
+    # --- Summary ---
+    print("\n------ Final Conversation History ------")
+    print(dumps(messages))
 
 
-# --- Summary ---
-print("\n------ Final Conversation History ------")
-print(json.dumps(messages, indent=2))
+# The model's API is async; run both questions on a single event loop.
+asyncio.run(main())
@@ -5,9 +5,51 @@ It provides a structured way to handle user inputs, model responses,
 and tool executions in a conversational context.
 """
 
-from typing import Any, Dict, List
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
 
-from mcp_meeting_assistant.mcp_client import MCPClient
+from mcp_meeting_assistant.mcp_host import MCPConnection
+
+# Inputs that end the chat session.
+EXIT_COMMANDS = frozenset({"exit", "Exit", "EXIT", "quit"})
+
+
+async def read_input(prompt: str) -> str:
+    """
+    Reads a line from standard input without blocking the event loop.
+
+    The blocking `input()` call runs in a daemon thread, so background work
+    (e.g., MCP notifications or prefetches) keeps running while the user types,
+    and a pending read does not keep the process alive on Ctrl+C.
+
+    Args:
+        prompt: The prompt to display.
+
+    Returns:
+        The line entered by the user.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def _set_result(result: str) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    def _set_exception(exc: BaseException) -> None:
+        if not future.done():
+            future.set_exception(exc)
+
+    def _read() -> None:
+        try:
+            result = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_set_exception, e)
+        else:
+            loop.call_soon_threadsafe(_set_result, result)
+
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
 
 
 class ChatSession:
@@ -16,17 +58,50 @@ class ChatSession:
     orchestrating calls to the MCP server for tools and prompts.
     """
 
-    def __init__(self, llm_service: Any, mcp_client: MCPClient):
+    def __init__(self, llm_service: Any, mcp_client: MCPConnection):
         """
         Initializes the ChatSession.
 
         Args:
             llm_service: An object responsible for interfacing with the LLM API.
-            mcp_client: A client for interacting with the MCP server.
+            mcp_client: A client or host for interacting with the MCP server(s).
         """
         self.llm_service: Any = llm_service
-        self.mcp_client: MCPClient = mcp_client
-        self.history: List[Dict[str, Any]] = []
+        self.mcp_client: MCPConnection = mcp_client
+        # Bound once, as it is called several times per turn.
+        self._add_message = llm_service.add_message_to_history
+        # The messages of the turn in progress are staged directly after the
+        # committed history, so each request reuses the same list without
+        # copying it. The committed prefix is append-only and never rewritten,
+        # which keeps the provider's prompt cache hitting; a failed turn only
+        # truncates its own staged tail.
+        self._messages: List[Dict[str, Any]] = []
+        self._committed_len: int = 0
+        # Tool definitions formatted for the LLM, refreshed while waiting for
+        # user input.
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        # Slash commands known to the server, fetched once at startup.
+        self._prompt_names: frozenset[str] = frozenset()
+        self._tip: str = ""
+
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """
+        The committed conversation history of completed turns.
+        """
+        return self._messages[: self._committed_len]
+
+    def _commit_turn(self) -> None:
+        """
+        Makes the messages staged during the current turn part of the history.
+        """
+        self._committed_len = len(self._messages)
+
+    def _rollback_turn(self) -> None:
+        """
+        Discards the messages staged during a turn that did not complete.
+        """
+        del self._messages[self._committed_len :]
 
     def _add_valid_model_response(
         self, response: Any, messages: List[Dict[str, Any]]
@@ -39,34 +114,76 @@ class ChatSession:
             response: The response object from the generative model.
             messages: The list of messages for the current turn to append to.
         """
-        if response and response.candidates and response.candidates[0].content.parts:
-            self.llm_service.add_message_to_history(
-                messages, response.candidates[0].content
-            )
+        if not response:
+            return
+        candidates = getattr(response, "candidates", None)
+        if not candidates:
+            return
+        content = candidates[0].content
+        if not getattr(content, "parts", None):
+            return
+        self._add_message(messages, content)
+
+    async def _refresh_prompts(self) -> None:
+        """
+        Updates the known slash commands and the tip listing them from the
+        server's prompts. The client caches the listing and drops it when the
+        server reports a change, so this is usually free.
+        """
+        prompts: List[str] = await self.mcp_client.list_prompts()
+        self._prompt_names = frozenset(prompts)
+        prompts_str: str = ", ".join(f"/{p}" for p in prompts)
+        self._tip = f"💡 Tip: Use slash commands (e.g., {prompts_str})"
 
     async def run(self) -> None:
         """
         Starts and manages the main interactive chat loop.
         """
         try:
-            prompts: List[str] = await self.mcp_client.list_prompts()
-            prompts_str: str = ", ".join(f"/{p}" for p in prompts)
-            print(f"💡 Tip: Use slash commands (e.g., {prompts_str})")
+            await self._refresh_prompts()
+            print(self._tip)
         except Exception as e:
             print(f"Could not fetch prompts: {e}")
 
         while True:
-            user_input: str = input("> ")
-            if user_input.lower() == "exit":
+            # Refresh the tools while the user is typing. The MCP client only
+            # asks the server again once its cached listing has expired, so
+            # this is usually free and always ready by the time input arrives.
+            tools_task: asyncio.Task = asyncio.create_task(
+                self.llm_service.get_tools(self.mcp_client)
+            )
+            user_input: str = await read_input("> ")
+            self._tools_cache = await tools_task
+
+            if user_input in EXIT_COMMANDS:
                 break
 
-            messages_for_this_turn: List[Dict[str, Any]] = list(self.history)
+            # Discard anything left over from a turn that did not complete.
+            self._rollback_turn()
 
             # Handle user input (slash command or regular message)
-            if user_input.startswith("/"):
-                parts: List[str] = user_input[1:].strip().split()
-                prompt_name: str = parts[0]
-                user_follow_up_text: str = " ".join(parts[1:])
+            if user_input[:1] == "/":
+                command, _, tail = user_input[1:].lstrip().partition(" ")
+                prompt_name: str = command.strip()
+                user_follow_up_text: str = tail.strip()
+
+                if not prompt_name:
+                    if self._tip:
+                        print(self._tip)
+                    continue
+
+                # Reject unknown commands locally instead of asking the server,
+                # after checking that the server has not added the prompt since.
+                if self._prompt_names and prompt_name not in self._prompt_names:
+                    try:
+                        await self._refresh_prompts()
+                    except Exception as e:
+                        print(f"Could not fetch prompts: {e}")
+                if self._prompt_names and prompt_name not in self._prompt_names:
+                    print(f"Unknown command: /{prompt_name}")
+                    if self._tip:
+                        print(self._tip)
+                    continue
 
                 print(f"--- Running prompt: {prompt_name} ---")
                 try:
@@ -77,59 +194,55 @@ class ChatSession:
                         full_user_message: str = (
                             f"{prompt_content}\n\n{user_follow_up_text}".strip()
                         )
-                        self.llm_service.add_message_to_history(
-                            messages_for_this_turn,
+                        self._add_message(
+                            self._messages,
                             {"role": "user", "parts": [{"text": full_user_message}]},
                         )
                 except Exception as e:
                     print(f"Error running prompt: {e}")
                     continue
             else:
-                self.llm_service.add_message_to_history(
-                    messages_for_this_turn,
+                self._add_message(
+                    self._messages,
                     {"role": "user", "parts": [{"text": user_input}]},
                 )
 
             # --- Main Conversational Flow ---
 
-            available_tools: List[Dict[str, Any]] = await self.llm_service.get_tools(
-                self.mcp_client
-            )
-            response: Any = self.llm_service.chat(
-                messages=messages_for_this_turn, tools=available_tools
+            available_tools: List[Dict[str, Any]] = self._tools_cache
+            response: Any = await self.llm_service.chat(
+                messages=self._messages, tools=available_tools
             )
 
             # If the chat call failed (e.g., 500 error), skip the rest of the loop.
             if response is None:
                 continue
 
-            self._add_valid_model_response(response, messages_for_this_turn)
+            self._add_valid_model_response(response, self._messages)
 
             tool_results: List[Dict[str, Any]] = (
                 await self.llm_service.execute_tool_requests(self.mcp_client, response)
             )
 
             if tool_results:
-                self.llm_service.add_message_to_history(
-                    messages_for_this_turn, {"role": "tool", "parts": tool_results}
+                self._add_message(
+                    self._messages, {"role": "tool", "parts": tool_results}
                 )
-                final_response_obj: Any = self.llm_service.chat(
-                    messages=messages_for_this_turn
+                final_response_obj: Any = await self.llm_service.chat(
+                    messages=self._messages
                 )
 
                 # If the final chat call failed, skip the rest of the loop.
                 if final_response_obj is None:
                     continue
 
-                self._add_valid_model_response(
-                    final_response_obj, messages_for_this_turn
-                )
+                self._add_valid_model_response(final_response_obj, self._messages)
                 final_text: str = self.llm_service.text_from_message(final_response_obj)
             else:
                 final_text: str = self.llm_service.text_from_message(response)
 
-            # If the flow was successful, update the permanent history
-            self.history = messages_for_this_turn
+            # If the flow was successful, commit this turn to the history
+            self._commit_turn()
 
             # Final check to ensure the user gets a meaningful response.
             if not final_text.strip():
@@ -7,6 +7,7 @@ It is designed to be run from the command line.
 """
 
 import asyncio
+import logging
 import os
 import sys
 from contextlib import AsyncExitStack
@@ -16,12 +17,20 @@ from dotenv import load_dotenv
 
 # Corrected import paths to match the project structure
 from mcp_meeting_assistant.chat_session import ChatSession
-from mcp_meeting_assistant.mcp_client import MCPClient
+from mcp_meeting_assistant.mcp_host import MCPHost
+from mcp_meeting_assistant.models.cache import CachedLLM
 from mcp_meeting_assistant.models.gemini import Gemini
 
 # Load environment variables from a .env file for configuration
 load_dotenv()
 
+# Diagnostics (e.g., tool calls) are logged at debug level; set LOG_LEVEL=DEBUG
+# to see them.
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(),
+    format="%(levelname)s %(name)s: %(message)s",
+)
+
 # Define the path to the MCP server script, making it relative to this file's location
 SERVER_PATH = os.path.join(os.path.dirname(__file__), "mcp_server.py")
 
@@ -33,35 +42,54 @@ async def main() -> None:
     This function performs the following steps:
     1. Determines which LLM service to use based on environment variables.
     2. Initializes the chosen LLM service (e.g., Gemini).
-    3. Starts the MCP server as a background process.
-    4. Establishes a client connection to the MCP server.
+    3. Starts the MCP servers as background processes.
+    4. Establishes client connections to the MCP servers.
     5. Initializes and runs the interactive chat session.
     """
     # For now, only the Gemini model is supported.
     # This structure allows for easy extension to other models in the future.
     model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash-lite")
-    llm_service: Any = Gemini(model_name=model_name)
+    temperature = os.getenv("GEMINI_TEMPERATURE")
+    # Identical requests are answered from an in-memory cache when the model
+    # samples deterministically (GEMINI_TEMPERATURE=0).
+    # Fixed instructions sent before every conversation, optionally stored in a
+    # server-side context cache shared by all sessions (GEMINI_PREFIX_CACHE_TTL).
+    prefix_file = os.getenv("GEMINI_PREFIX_FILE")
+    prefix_messages = None
+    if prefix_file:
+        with open(os.path.expanduser(prefix_file), encoding="utf-8") as f:
+            prefix_messages = [{"role": "user", "parts": [{"text": f.read()}]}]
+    prefix_cache_ttl = os.getenv("GEMINI_PREFIX_CACHE_TTL")
+    gemini = Gemini(
+        model_name=model_name,
+        temperature=float(temperature) if temperature else None,
+        prefix_messages=prefix_messages,
+        prefix_cache_ttl=int(prefix_cache_ttl) if prefix_cache_ttl else None,
+    )
+    llm_service: Any = CachedLLM(gemini)
     print(f"Initializing with model: {model_name}")
 
     # The AsyncExitStack ensures that all resources (like the MCP client)
     # are cleaned up properly when the application exits, even if errors occur.
     async with AsyncExitStack() as stack:
-        # Define the command to start the MCP server.
+        # Closed last, after the MCP servers that may still send sampling
+        # requests, so pending cache writes reach the disk.
+        stack.push_async_callback(gemini.aclose)
+
+        # Define the command to start each MCP server, keyed by server name.
         # Using sys.executable ensures we use the same Python interpreter
         # that is running this script.
-        command, args = (sys.executable, [SERVER_PATH])
-
-        # Connect to the MCP server. The client manages the server's lifecycle.
-        mcp_client = await stack.enter_async_context(
-            MCPClient(
-                command=command,
-                args=args,
-                sampling_callback=llm_service.sampling_callback,
-            )
+        server_specs = {"meeting": (sys.executable, [SERVER_PATH])}
+
+        # Connect to all MCP servers concurrently. The host manages the
+        # servers' lifecycles and routes tool and prompt calls between them.
+        mcp_host = await stack.enter_async_context(
+            MCPHost(sampling_callback=llm_service.sampling_callback)
         )
+        await mcp_host.connect_all(server_specs)
 
-        # Create the chat session, injecting the LLM service and MCP client
-        chat_session = ChatSession(llm_service, mcp_client)
+        # Create the chat session, injecting the LLM service and MCP host
+        chat_session = ChatSession(llm_service, mcp_host)
 
         print("\n=======================================")
         print("Chat session started (type 'exit' to quit)")
@@ -5,12 +5,24 @@ and prompts, handling the lifecycle of the server process and providing methods
 interact with its features.
 """
 
+import asyncio
+import concurrent.futures
 from contextlib import AsyncExitStack
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from mcp.types import CallToolResult, Tool
+from mcp.types import (
+    CallToolResult,
+    PromptListChangedNotification,
+    ServerNotification,
+    Tool,
+    ToolListChangedNotification,
+)
+
+# How long (in seconds) the tool and prompt listings are reused before the
+# server is asked again. Both rarely change during a session.
+TOOLS_TTL_SECONDS: float = 60.0
 
 
 class MCPClient:
@@ -20,7 +32,10 @@ class MCPClient:
 
     This class handles the lifecycle of the server process and provides
     methods to interact with its tools and prompts. It is designed to be
-    used as an async context manager.
+    used as an async context manager, or via explicit `connect()` and
+    `cleanup()` calls. A single instance owns one server process and one
+    session, which are reused for every tool and prompt request; create it
+    once per application rather than per call.
     """
 
     def __init__(
@@ -46,12 +61,31 @@ class MCPClient:
         self._env: Optional[Dict[str, str]] = env
         self._session: Optional[ClientSession] = None
         self._exit_stack: AsyncExitStack = AsyncExitStack()
+        self._connect_lock: asyncio.Lock = asyncio.Lock()
         self._sampling_callback = sampling_callback
+        # A single in-flight or completed tool listing, shared by all callers.
+        self._tools_future: Optional[asyncio.Future] = None
+        self._tools_cached_at: float = 0.0
+        self._tools_lock: asyncio.Lock = asyncio.Lock()
+        self._prompts_cache: Optional[List[str]] = None
+        self._prompts_cached_at: float = 0.0
 
     async def connect(self) -> None:
         """
         Establishes a connection to the stdio server process and initializes
         the client session.
+
+        Calling this on an already connected client is a no-op, and concurrent
+        calls share a single connection attempt.
+        """
+        async with self._connect_lock:
+            if self._session is not None:
+                return
+            await self._connect()
+
+    async def _connect(self) -> None:
+        """
+        Starts the server process and initializes the client session.
         """
         server_params = StdioServerParameters(
             command=self._command,
@@ -62,10 +96,56 @@ class MCPClient:
             stdio_client(server_params)
         )
         _stdio, _write = stdio_transport
-        self._session = await self._exit_stack.enter_async_context(
-            ClientSession(_stdio, _write, sampling_callback=self._sampling_callback)
+        session = await self._exit_stack.enter_async_context(
+            ClientSession(
+                _stdio,
+                _write,
+                sampling_callback=self._sampling_callback,
+                message_handler=self._handle_message,
+            )
         )
-        await self._session.initialize()
+        await session.initialize()
+        # Only publish the session once the handshake has completed.
+        self._session = session
+
+    async def serve_until(
+        self,
+        closing: asyncio.Event,
+        connected: Union[asyncio.Future, concurrent.futures.Future],
+    ) -> None:
+        """
+        Connects, then keeps the connection open until `closing` is set.
+
+        The stdio transport is task-scoped: it has to be entered and exited
+        in the same task. Running this coroutine as one long-lived task lets
+        other tasks use the client in between.
+
+        Args:
+            closing: An event that, once set, disconnects the client.
+            connected: A future resolved once the client is connected, or
+                       failed with the error if connecting fails.
+        """
+        try:
+            async with self:
+                connected.set_result(None)
+                await closing.wait()
+        except BaseException as e:
+            if connected.done():
+                raise
+            connected.set_exception(e)
+
+    async def _handle_message(self, message: Any) -> None:
+        """
+        Handles incoming server messages, dropping the cached listings when
+        the server reports that its tools or prompts have changed.
+
+        Args:
+            message: A request, notification or exception from the server.
+        """
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, (ToolListChangedNotification, PromptListChangedNotification)
+        ):
+            self.invalidate_tools()
 
     def session(self) -> ClientSession:
         """
@@ -85,12 +165,49 @@ class MCPClient:
         """
         Fetches the list of available tools from the MCP server.
 
+        The listing is cached for `TOOLS_TTL_SECONDS`, so repeated calls
+        within a session do not round-trip to the server. Concurrent callers
+        share a single request instead of each sending their own. Use
+        `invalidate_tools` to force a refresh.
+
         Returns:
             A list of Tool objects.
         """
+        async with self._tools_lock:
+            now = asyncio.get_running_loop().time()
+            if (
+                self._tools_future is None
+                or now - self._tools_cached_at > TOOLS_TTL_SECONDS
+            ):
+                self._tools_future = asyncio.ensure_future(self._fetch_tools())
+                self._tools_cached_at = now
+            future = self._tools_future
+
+        try:
+            # Shield the shared request, so a cancelled caller does not cancel
+            # it for everyone else waiting on it.
+            return await asyncio.shield(future)
+        except Exception:
+            # Failures are not cached; the next call tries again.
+            if self._tools_future is future:
+                self._tools_future = None
+            raise
+
+    async def _fetch_tools(self) -> List[Tool]:
+        """
+        Requests the list of available tools from the MCP server.
+        """
         result = await self.session().list_tools()
         return result.tools
 
+    def invalidate_tools(self) -> None:
+        """
+        Drops the cached tool and prompt listings so that the next call to
+        `list_tools` or `list_prompts` fetches them from the server again.
+        """
+        self._tools_future = None
+        self._prompts_cache = None
+
     async def call_tool(
         self, tool_name: str, tool_input: Dict[str, Any]
     ) -> CallToolResult:
@@ -119,9 +236,6 @@ class MCPClient:
         Returns:
             The raw text content of the prompt, or None if the prompt is empty.
         """
-        if not self._session:
-            raise ConnectionError("Not connected to the MCP server.")
-
         prompt_result = await self.session().get_prompt(name, arguments or {})
 
         if prompt_result and prompt_result.messages:
@@ -132,14 +246,21 @@ class MCPClient:
         """
         Lists all available prompts on the MCP server.
 
+        Like `list_tools`, the result is cached for `TOOLS_TTL_SECONDS`.
+
         Returns:
             A list of prompt names.
         """
-        if not self._session:
-            raise ConnectionError("Not connected to the MCP server.")
-
-        prompts_result = await self.session().list_prompts()
-        return [prompt.name for prompt in prompts_result.prompts]
+        session = self.session()
+        now = asyncio.get_running_loop().time()
+        if (
+            self._prompts_cache is None
+            or now - self._prompts_cached_at > TOOLS_TTL_SECONDS
+        ):
+            prompts_result = await session.list_prompts()
+            self._prompts_cache = [prompt.name for prompt in prompts_result.prompts]
+            self._prompts_cached_at = now
+        return self._prompts_cache
 
     async def cleanup(self) -> None:
         """
@@ -147,6 +268,7 @@ class MCPClient:
         """
         await self._exit_stack.aclose()
         self._session = None
+        self.invalidate_tools()
 
     async def __aenter__(self) -> "MCPClient":
         """
@@ -0,0 +1,203 @@
+"""
+This module provides a host that manages connections to several MCP servers
+at once. It connects to all servers concurrently, merges their tools and
+prompts, and routes each call to the server that provides it, exposing the
+same interface as a single MCPClient.
+"""
+
+import asyncio
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
+
+from mcp.types import CallToolResult, Tool
+
+from mcp_meeting_assistant.mcp_client import MCPClient
+
+
+class MCPHost:
+    """
+    Manages a pool of named MCP server connections.
+
+    Each server is driven by its own MCPClient. Tools and prompts of all
+    servers are collected into registries, so callers can use the host in
+    place of a single client. It is designed to be used as an async context
+    manager, with `connect_all()` called once inside it.
+    """
+
+    def __init__(
+        self,
+        sampling_callback: Optional[
+            Callable[[Any, Any], Coroutine[Any, Any, Any]]
+        ] = None,
+    ):
+        """
+        Initializes the MCPHost.
+
+        Args:
+            sampling_callback: An async function to handle LLM calls from the servers.
+        """
+        self._sampling_callback = sampling_callback
+        self.clients: Dict[str, MCPClient] = {}
+        # Maps a tool name to the name of the server providing it and the tool.
+        self.tool_registry: Dict[str, Tuple[str, Tool]] = {}
+        # Maps a prompt name to the name of the server providing it.
+        self.prompt_registry: Dict[str, str] = {}
+        # The per-server tool listings the merged listing was built from.
+        self._tools_sources: List[List[Tool]] = []
+        self._tools: List[Tool] = []
+        self._tasks: List[asyncio.Task] = []
+        self._closing: asyncio.Event = asyncio.Event()
+
+    async def connect_all(self, server_specs: Dict[str, Tuple[str, List[str]]]) -> None:
+        """
+        Connects to all given servers concurrently, so startup takes as long
+        as the slowest server rather than the sum of all of them.
+
+        Args:
+            server_specs: A mapping of server names to `(command, args)` tuples
+                          used to start each server.
+        """
+        loop = asyncio.get_running_loop()
+        ready: List[asyncio.Future] = []
+        for name, (command, args) in server_specs.items():
+            client = MCPClient(
+                command=command,
+                args=args,
+                sampling_callback=self._sampling_callback,
+            )
+            connected: asyncio.Future = loop.create_future()
+            self.clients[name] = client
+            self._tasks.append(
+                asyncio.create_task(client.serve_until(self._closing, connected))
+            )
+            ready.append(connected)
+
+        await asyncio.gather(*ready)
+        await self.list_tools()
+        await self.list_prompts()
+
+    async def list_tools(self) -> List[Tool]:
+        """
+        Fetches the tools of all servers and refreshes the tool registry.
+
+        If several servers provide a tool with the same name, the first one
+        registered is used. While every server returns its cached listing,
+        the same merged list object is returned, so callers can reuse work
+        derived from it.
+
+        Returns:
+            A list of Tool objects from all servers.
+        """
+        names = list(self.clients)
+        results = await asyncio.gather(
+            *(self.clients[name].list_tools() for name in names)
+        )
+        if len(results) == len(self._tools_sources) and all(
+            tools is source for tools, source in zip(results, self._tools_sources)
+        ):
+            return self._tools
+
+        registry: Dict[str, Tuple[str, Tool]] = {}
+        for name, tools in zip(names, results):
+            for tool in tools:
+                registry.setdefault(tool.name, (name, tool))
+        self.tool_registry = registry
+        self._tools_sources = results
+        self._tools = [tool for _, tool in registry.values()]
+        return self._tools
+
+    async def call_tool(
+        self, tool_name: str, tool_input: Dict[str, Any]
+    ) -> CallToolResult:
+        """
+        Calls a tool on the server that provides it.
+
+        Args:
+            tool_name: The name of the tool to call.
+            tool_input: A dictionary of arguments for the tool.
+
+        Returns:
+            The response from the tool call.
+
+        Raises:
+            ValueError: If no connected server provides the tool.
+        """
+        entry = self.tool_registry.get(tool_name)
+        if entry is None:
+            raise ValueError(f"Unknown tool: {tool_name}")
+        return await self.clients[entry[0]].call_tool(tool_name, tool_input)
+
+    async def list_prompts(self) -> List[str]:
+        """
+        Lists the prompts of all servers and refreshes the prompt registry.
+
+        Returns:
+            A list of prompt names.
+        """
+        names = list(self.clients)
+        results = await asyncio.gather(
+            *(self.clients[name].list_prompts() for name in names)
+        )
+        registry: Dict[str, str] = {}
+        for name, prompts in zip(names, results):
+            for prompt in prompts:
+                registry.setdefault(prompt, name)
+        self.prompt_registry = registry
+        return list(registry)
+
+    async def run_prompt(
+        self, name: str, arguments: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Gets a prompt from the server that provides it.
+
+        Args:
+            name: The name of the prompt to run.
+            arguments: An optional dictionary of arguments for the prompt.
+
+        Returns:
+            The raw text content of the prompt, or None if the prompt is empty.
+
+        Raises:
+            ValueError: If no connected server provides the prompt.
+        """
+        server_name = self.prompt_registry.get(name)
+        if server_name is None:
+            raise ValueError(f"Unknown prompt: {name}")
+        return await self.clients[server_name].run_prompt(name, arguments)
+
+    def invalidate_tools(self) -> None:
+        """
+        Drops the cached tool and prompt listings of all servers.
+        """
+        for client in self.clients.values():
+            client.invalidate_tools()
+
+    async def cleanup(self) -> None:
+        """
+        Disconnects from all servers and stops their processes.
+        """
+        self._closing.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self.clients.clear()
+        self.tool_registry.clear()
+        self.prompt_registry.clear()
+        self._tools_sources = []
+        self._tools = []
+
+    async def __aenter__(self) -> "MCPHost":
+        """
+        Enters the async context. Servers are connected with `connect_all`.
+        """
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """
+        Exits the async context, disconnecting from all servers.
+        """
+        await self.cleanup()
+
+
+# Either a single server connection or a pool of them; both expose the same
+# tool and prompt methods.
+MCPConnection = Union[MCPClient, MCPHost]
@@ -5,6 +5,9 @@ It uses the MCP framework to create a structured server with tools and prompts.
 It is designed to be run as a standalone server application.
 """
 
+import io
+from dataclasses import dataclass, field
+
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.fastmcp.prompts import base
 from mcp.types import SamplingMessage, TextContent
@@ -23,9 +26,18 @@ mcp = FastMCP(
 )
 
 # --- 2. In-Memory Data Store ---
-# A dictionary to hold meeting data. The structure is:
-# { "meeting_topic": {"attendees": [...], "action_items": [...]}}
-meetings: dict[str, dict] = {}
+
+
+@dataclass(slots=True)
+class Meeting:
+    """The attendees and action items recorded for a single meeting."""
+
+    attendees: list[str] = field(default_factory=list)
+    action_items: list[str] = field(default_factory=list)
+
+
+# A dictionary to hold meeting data, keyed by the meeting topic.
+meetings: dict[str, Meeting] = {}
 
 
 # --- 3. Tool Definitions with Decorators ---
@@ -34,13 +46,15 @@ meetings: dict[str, dict] = {}
 @mcp.tool()
 def schedule_meeting(
     topic: str = Field(description="The unique topic or title of the meeting."),
-):
+) -> str:
     """Schedules a new, empty meeting with a given topic."""
     print(f"Executing: schedule_meeting for topic '{topic}'")
-    if topic in meetings:
+    # setdefault checks and inserts with a single lookup; a different object
+    # coming back means the topic was already taken.
+    meeting = Meeting()
+    if meetings.setdefault(topic, meeting) is not meeting:
         return f"Error: A meeting with the topic '{topic}' already exists."
 
-    meetings[topic] = {"attendees": [], "action_items": []}
     return f"Successfully scheduled new meeting: '{topic}'"
 
 
@@ -48,13 +62,14 @@ def schedule_meeting(
 def add_attendee(
     topic: str = Field(description="The topic of the meeting to add an attendee to."),
     name: str = Field(description="The name of the person attending the meeting."),
-):
+) -> str:
     """Adds an attendee to a specific meeting."""
     print(f"Executing: add_attendee '{name}' to '{topic}'")
-    if topic not in meetings:
+    meeting = meetings.get(topic)
+    if meeting is None:
         return f"Error: Meeting '{topic}' not found."
 
-    meetings[topic]["attendees"].append(name)
+    meeting.attendees.append(name)
     return f"Successfully added attendee '{name}' to meeting '{topic}'."
 
 
@@ -62,53 +77,57 @@ def add_attendee(
 def add_action_item(
     topic: str = Field(description="The topic of the meeting for the action item."),
     item: str = Field(description="The description of the action item."),
-):
+) -> str:
     """Adds an action item to a specific meeting."""
     print(f"Executing: add_action_item '{item}' for '{topic}'")
-    if topic not in meetings:
+    meeting = meetings.get(topic)
+    if meeting is None:
         return f"Error: Meeting '{topic}' not found."
 
-    meetings[topic]["action_items"].append(item)
+    meeting.action_items.append(item)
     return f"Successfully added action item to meeting '{topic}': '{item}'"
 
 
 @mcp.tool()
 def get_meeting_details(
     topic: str = Field(description="The topic of the meeting to get details for."),
-):
+) -> str:
     """Retrieves the attendees and action items for a specific meeting."""
     print(f"Executing: get_meeting_details for '{topic}'")
-    if topic not in meetings:
+    meeting = meetings.get(topic)
+    if meeting is None:
         return f"Error: Meeting '{topic}' not found."
 
-    details = meetings[topic]
-    attendees = ", ".join(details["attendees"]) if details["attendees"] else "None"
-
-    if not details["action_items"]:
-        action_items_formatted = "No action items."
+    # Write the report into a single buffer instead of building and
+    # interpolating intermediate strings.
+    buf = io.StringIO()
+    buf.write("Details for meeting '")
+    buf.write(topic)
+    buf.write("':\nAttendees: ")
+    buf.write(", ".join(meeting.attendees) if meeting.attendees else "None")
+    buf.write("\nAction Items:\n")
+
+    if not meeting.action_items:
+        buf.write("No action items.")
     else:
-        action_items_formatted = "\n".join(
-            f"- {item}" for item in details["action_items"]
-        )
-
-    return (
-        f"Details for meeting '{topic}':\n"
-        f"Attendees: {attendees}\n"
-        f"Action Items:\n{action_items_formatted}"
-    )
+        for i, item in enumerate(meeting.action_items):
+            if i:
+                buf.write("\n")
+            buf.write("- ")
+            buf.write(item)
+
+    return buf.getvalue()
 
 
 @mcp.tool()
-def list_all_meetings():
+def list_all_meetings() -> str:
     """Lists the topics of all currently scheduled meetings."""
     print("Executing: list_all_meetings")
     if not meetings:
         return "There are no meetings scheduled at the moment."
 
-    meeting_topics = meetings.keys()
-
     # Return a simple list of topics for the model to process
-    return "\n".join(list(meeting_topics))
+    return "\n".join(meetings)
 
 # --- 4. Sampling Methods ---
 
@@ -119,7 +138,7 @@ async def brainstorm_action_items(
     context_summary: str = Field(
         description="A brief summary of the meeting's context or goals."
     ),
-):
+) -> str:
     """Brainstorms new, creative action items for a meeting based on its topic and context."""
     print(f"Executing: brainstorm_action_items for topic '{topic}'")
 
@@ -147,31 +166,29 @@ async def brainstorm_action_items(
 
 
 # --- 5. Prompt Definitions ---
+# The prompt texts are static, so their messages are built once at import
+# time and shared by every request instead of being rebuilt per call.
 
-
-@mcp.prompt(
-    name="minutes",
-    description="Generate meeting minutes from the details.",
-)
-def generate_minutes():
-    """Generates formatted meeting minutes for a specific meeting."""
-    prompt = """
+_MINUTES_PROMPT = """
     Your goal is to create and present the meeting minutes.
     First, you may need to ask the user which meeting they want a summary for.
     Then, use the 'get_meeting_details' tool with the correct meeting topic.
     Finally, present the retrieved details back to the user in a clean, readable format
     under the heading 'Meeting Minutes for: [Topic]'.
     """
-    return [base.UserMessage(prompt)]
+_MINUTES_MESSAGES: list[base.Message] = [base.UserMessage(_MINUTES_PROMPT)]
 
 
 @mcp.prompt(
-    name="kickoff",
-    description="Plan a new project kickoff meeting.",
+    name="minutes",
+    description="Generate meeting minutes from the details.",
 )
-def plan_project_kickoff():
-    """Sets up a standard project kickoff meeting with initial attendees and tasks."""
-    prompt = """
+def generate_minutes() -> list[base.Message]:
+    """Generates formatted meeting minutes for a specific meeting."""
+    return _MINUTES_MESSAGES
+
+
+_KICKOFF_PROMPT = """
     Your goal is to automate the setup for a new project kickoff meeting.
     1. Ask the user for the project name to use as the meeting topic.
     2. Use the 'schedule_meeting' tool to create the meeting.
@@ -179,19 +196,19 @@ def plan_project_kickoff():
     4. Use the 'add_action_item' tool to add an initial task: 'Finalize project scope and charter.'
     5. Confirm to the user that the kickoff meeting has been set up with the initial details.
     """
-    return [base.UserMessage(prompt)]
+_KICKOFF_MESSAGES: list[base.Message] = [base.UserMessage(_KICKOFF_PROMPT)]
 
 
 @mcp.prompt(
-    name="format",
-    description="Format all meetings into a markdown report.",
+    name="kickoff",
+    description="Plan a new project kickoff meeting.",
 )
-def format_meetings_as_markdown():
-    """
-    Retrieves all meetings and their details and formats them as a
-    comprehensive Markdown report.
-    """
-    prompt = """
+def plan_project_kickoff() -> list[base.Message]:
+    """Sets up a standard project kickoff meeting with initial attendees and tasks."""
+    return _KICKOFF_MESSAGES
+
+
+_FORMAT_PROMPT = """
     Your goal is to create a comprehensive Markdown report of all scheduled meetings.
     1. First, call the 'list_all_meetings' tool to get the list of all meeting topics.
     2. If there are no meetings, inform the user that the list is empty.
@@ -202,18 +219,22 @@ def format_meetings_as_markdown():
     6. Each meeting should be its own sub-section with a level 2 heading, like '## Meeting: [Topic]'.
     7. Under each meeting, list the 'Attendees' and 'Action Items' with bullet points.
     """
-    return [base.UserMessage(prompt)]
+_FORMAT_MESSAGES: list[base.Message] = [base.UserMessage(_FORMAT_PROMPT)]
 
 
 @mcp.prompt(
-    name="demo",
-    description="Populate the server with random meeting data for a demo.",
+    name="format",
+    description="Format all meetings into a markdown report.",
 )
-def populate_demo_data():
+def format_meetings_as_markdown() -> list[base.Message]:
     """
-    Guides the model to populate the meeting list with sample data for demonstration purposes.
+    Retrieves all meetings and their details and formats them as a
+    comprehensive Markdown report.
     """
-    prompt = """
+    return _FORMAT_MESSAGES
+
+
+_DEMO_PROMPT = """
     Your goal is to populate the application with realistic demo data.
     You must perform the following actions in sequence:
 
@@ -240,7 +261,18 @@ def populate_demo_data():
     5.  **Confirmation:**
         * After all tool calls are complete, respond to the user with a single message: "Demo data has been successfully created."
     """
-    return [base.UserMessage(prompt)]
+_DEMO_MESSAGES: list[base.Message] = [base.UserMessage(_DEMO_PROMPT)]
+
+
+@mcp.prompt(
+    name="demo",
+    description="Populate the server with random meeting data for a demo.",
+)
+def populate_demo_data() -> list[base.Message]:
+    """
+    Guides the model to populate the meeting list with sample data for demonstration purposes.
+    """
+    return _DEMO_MESSAGES
 
 
 # --- 5. Run the Server ---
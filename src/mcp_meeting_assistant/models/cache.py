@@ -0,0 +1,202 @@
+"""
+This module provides in-memory caching helpers for model wrappers.
+It includes a small bounded LRU cache and a `CachedLLM` wrapper that
+short-circuits identical chat requests so they are not sent to the LLM again.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from google.generativeai.types import GenerateContentResponse
+from mcp.client.session import RequestContext
+from mcp.types import CreateMessageRequestParams, CreateMessageResult
+
+from mcp_meeting_assistant.mcp_host import MCPConnection
+from mcp_meeting_assistant.models.model import Model
+from mcp_meeting_assistant.models.semantic_cache import DEFAULT_SCOPE
+
+
+class LRUCache:
+    """
+    A bounded mapping that evicts the least recently used entry once it grows
+    beyond its maximum size.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initializes the LRUCache.
+
+        Args:
+            max_size: The maximum number of entries to keep.
+        """
+        self.max_size: int = max_size
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value stored for a key and marks it as recently used.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The cached value, or None if the key is not present.
+        """
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the oldest entry if the cache is full.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to store.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def request_key(**parts: Any) -> str:
+    """
+    Builds a stable cache key from the given request parts.
+
+    Values that are not JSON serializable (e.g., protobuf messages returned
+    by the model) are serialized through their string representation.
+
+    Args:
+        **parts: The named parts of the request (e.g., messages and tools).
+
+    Returns:
+        A hex digest identifying the request.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+def deterministic(temperature: Optional[float]) -> bool:
+    """
+    Returns whether a model samples deterministically at a temperature, which
+    is when replaying a cached response cannot hide the model's variability.
+
+    Args:
+        temperature: The sampling temperature, or None for the model default.
+
+    Returns:
+        True if the temperature is set to 0 or below.
+    """
+    return temperature is not None and temperature <= 0
+
+
+class CachedLLM(Model):
+    """
+    Wraps a model and caches its chat responses in memory, so that an
+    identical request (same messages, tools and model) is answered without
+    calling the LLM API again.
+
+    Caching only applies when the wrapped model samples deterministically
+    (temperature 0); otherwise every request is passed through, since
+    replaying a sampled response would hide the model's variability.
+    """
+
+    def __init__(self, llm_service: Model, max_size: int = 256):
+        """
+        Initializes the CachedLLM wrapper.
+
+        Args:
+            llm_service: The model wrapper to delegate to (e.g., Gemini).
+            max_size: The maximum number of responses to keep in the cache.
+        """
+        self.llm_service: Model = llm_service
+        self.model_name: str = getattr(llm_service, "model_name", "")
+        self._cache: LRUCache = LRUCache(max_size)
+
+    @property
+    def cacheable(self) -> bool:
+        """
+        Whether responses from the wrapped model may be served from the cache.
+        """
+        return deterministic(getattr(self.llm_service, "temperature", None))
+
+    async def sampling_callback(
+        self, context: RequestContext, params: CreateMessageRequestParams
+    ) -> CreateMessageResult:
+        return await self.llm_service.sampling_callback(context, params)
+
+    async def ask(
+        self,
+        question: str,
+        messages_history: List[Dict[str, Any]],
+        scope: str = DEFAULT_SCOPE,
+    ) -> str:
+        return await self.llm_service.ask(question, messages_history, scope)
+
+    async def ask_batch(
+        self,
+        questions: List[str],
+        messages_history: List[Dict[str, Any]],
+        scope: str = DEFAULT_SCOPE,
+        max_concurrency: int = 8,
+    ) -> List[str]:
+        return await self.llm_service.ask_batch(
+            questions, messages_history, scope, max_concurrency
+        )
+
+    async def chat(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[GenerateContentResponse]:
+        """
+        Returns the cached response for an identical request, or forwards the
+        request to the wrapped model and caches a successful response.
+
+        Args:
+            messages: A list of message objects representing the conversation history.
+            tools: An optional list of tools available for the model to call.
+
+        Returns:
+            The model's response, or `None` if the underlying call failed.
+        """
+        if not self.cacheable:
+            return await self.llm_service.chat(messages=messages, tools=tools)
+
+        key = request_key(m=messages, t=tools, model=self.model_name)
+        response = self._cache.get(key)
+        if response is None:
+            response = await self.llm_service.chat(messages=messages, tools=tools)
+            if response is not None:
+                self._cache.put(key, response)
+        return response
+
+    @staticmethod
+    def add_message_to_history(
+        messages: List[Dict[str, Any]], message: Dict[str, Any]
+    ) -> None:
+        messages.append(message)
+
+    def text_from_message(self, response: Optional[GenerateContentResponse]) -> str:
+        return self.llm_service.text_from_message(response)
+
+    async def get_tools(self, client: MCPConnection) -> List[Dict[str, Any]]:
+        return await self.llm_service.get_tools(client)
+
+    async def execute_tool_requests(
+        self, client: MCPConnection, response: Optional[GenerateContentResponse]
+    ) -> List[Dict[str, Any]]:
+        return await self.llm_service.execute_tool_requests(client, response)
@@ -5,23 +5,82 @@ It includes methods for asking questions, managing conversation history,
 and handling tool requests in a format compatible with the Gemini API.
 """
 
+import asyncio
+import datetime
 import json
+import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import google.generativeai as genai
 from google.api_core import exceptions as google_exceptions
+from google.generativeai import caching
 from google.generativeai.types import GenerateContentResponse
 from mcp.client.session import RequestContext
 from mcp.types import CreateMessageRequestParams, CreateMessageResult, TextContent, Tool
 
-from mcp_meeting_assistant.mcp_client import MCPClient
+from mcp_meeting_assistant.mcp_host import MCPConnection
+from mcp_meeting_assistant.models.cache import LRUCache, deterministic, request_key
 from mcp_meeting_assistant.models.model import Model
+from mcp_meeting_assistant.models.persistent_cache import PersistentCache
+from mcp_meeting_assistant.models.semantic_cache import DEFAULT_SCOPE, SemanticCache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Serializes an object to a JSON string using orjson."""
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        """Serializes an object to a JSON string using the standard library."""
+        return json.dumps(obj)
+
+
+# The maximum number of answers kept by the exact-match cache in `ask`.
+EXACT_CACHE_SIZE = 512
+
+# The maximum number of distinct sampling configurations kept for reuse.
+SAMPLING_CONFIG_CACHE_SIZE = 32
+
+# The display name prefix of the server-side caches holding prefix messages.
+PREFIX_CACHE_DISPLAY_NAME = "mcp-meeting-assistant"
+
+# How long before its expiry a prefix cache is extended.
+PREFIX_CACHE_REFRESH_MARGIN = datetime.timedelta(seconds=60)
+
+# How long to send the prefix inline after a transient caching error.
+PREFIX_CACHE_RETRY_SECONDS = 60.0
+
+# The number of server-side caches fetched per request when looking for a
+# shared prefix cache. The SDK default of 1 costs one request per cache.
+PREFIX_CACHE_LIST_PAGE_SIZE = 1000
+
+# Upper-case forms of the JSON schema type names, to avoid calling
+# `str.upper()` on every "type" value.
+_TYPE_UPCASE: Dict[str, str] = {
+    name: name.upper()
+    for name in ("string", "number", "integer", "boolean", "array", "object", "null")
+}
+
+
+def _role(message: Any) -> Optional[str]:
+    """
+    Returns the role of a history message, which is either a dictionary or a
+    `Content` object returned by the model.
+    """
+    if isinstance(message, dict):
+        return message.get("role")
+    return getattr(message, "role", None)
 
 
 def clean_schema(schema: Any) -> Any:
     """
-    Recursively cleans a JSON schema to be compatible with Gemini's API.
+    Cleans a JSON schema to be compatible with Gemini's API.
     This is necessary because the Gemini API has stricter requirements for
     the schema format than the default Pydantic output.
 
@@ -29,25 +88,45 @@ def clean_schema(schema: Any) -> Any:
     - Removes the 'title' field from properties.
     - Converts the 'type' field's value to uppercase (e.g., 'string' -> 'STRING').
 
+    The schema is walked iteratively with an explicit stack, so deeply
+    nested schemas do not pay for (or overflow) Python recursion.
+
     Args:
         schema: The JSON schema (as a dict or list) to be cleaned.
 
     Returns:
         The cleaned JSON schema.
     """
-    if isinstance(schema, dict):
-        new_schema = {}
-        for key, value in schema.items():
-            if key == "title":
-                continue
-            if key == "type" and isinstance(value, str):
-                new_schema[key] = value.upper()
-            else:
-                new_schema[key] = clean_schema(value)
-        return new_schema
-    if isinstance(schema, list):
-        return [clean_schema(item) for item in schema]
-    return schema
+    if not isinstance(schema, (dict, list)):
+        return schema
+
+    root: List[Any] = [None]
+    # Each entry is a source node plus the container and key its cleaned
+    # copy is written to.
+    stack: List[Tuple[Any, Any, Any]] = [(schema, root, 0)]
+    while stack:
+        node, parent, slot = stack.pop()
+        if isinstance(node, dict):
+            cleaned: Any = {}
+            for key, value in node.items():
+                if key == "title":
+                    continue
+                if key == "type" and isinstance(value, str):
+                    cleaned[key] = _TYPE_UPCASE.get(value) or value.upper()
+                elif isinstance(value, (dict, list)):
+                    # Reserve the key now so that the output keeps the
+                    # original key order.
+                    cleaned[key] = None
+                    stack.append((value, cleaned, key))
+                else:
+                    cleaned[key] = value
+        else:
+            cleaned = list(node)
+            for index, value in enumerate(node):
+                if isinstance(value, (dict, list)):
+                    stack.append((value, cleaned, index))
+        parent[slot] = cleaned
+    return root[0]
 
 
 class Gemini(Model):
@@ -56,25 +135,127 @@ class Gemini(Model):
     formatting data, and handling API-specific errors.
     """
 
-    def __init__(self, model_name: str):
+    def __init__(
+        self,
+        model_name: str,
+        temperature: Optional[float] = None,
+        max_tool_concurrency: int = 8,
+        prefix_messages: Optional[List[Dict[str, Any]]] = None,
+        max_turns: Optional[int] = 20,
+        max_input_tokens: Optional[int] = None,
+        prefix_cache_ttl: Optional[int] = None,
+    ):
         """
         Initializes the Gemini service wrapper.
 
         Args:
             model_name: The name of the Gemini model to use (e.g., 'gemini-pro').
+            temperature: An optional sampling temperature for chat requests.
+                         If omitted, the model's default is used.
+            max_tool_concurrency: The maximum number of tool calls from one
+                                  response that run at the same time.
+            prefix_messages: Optional fixed messages (e.g., instructions or a
+                             user profile) sent before the conversation in
+                             every chat request.
+            max_turns: The maximum number of recent conversation turns sent
+                       with a chat request, or None to always send the whole
+                       history.
+            max_input_tokens: An optional token budget for a chat request.
+                              Older turns are dropped until the request fits,
+                              at the cost of a token count call per request.
+            prefix_cache_ttl: If set, the prefix messages are stored once in
+                              a server-side context cache with this lifetime
+                              in seconds, shared by all sessions using the
+                              same model and prefix, and requests refer to
+                              it instead of resending the prefix.
+
+        Raises:
+            ValueError: If `max_turns` is less than 1.
         """
+        if max_turns is not None and max_turns < 1:
+            raise ValueError(f"max_turns must be None or at least 1, got {max_turns}")
         genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-        self.model = genai.GenerativeModel(model_name)
+        self.model_name: str = model_name
+        self.temperature: Optional[float] = temperature
+        self.max_tool_concurrency: int = max_tool_concurrency
+        # Set once and never modified, so every request starts with the same
+        # bytes and the server can reuse its prompt cache for them.
+        self._prefix_messages: List[Dict[str, Any]] = list(prefix_messages or [])
+        self.max_turns: Optional[int] = max_turns
+        self.max_input_tokens: Optional[int] = max_input_tokens
+        self.prefix_cache_ttl: Optional[int] = prefix_cache_ttl
+        # The server-side cache of the prefix messages and a model bound to it,
+        # created on first use. Once creating it fails (e.g., because the
+        # prefix is below the minimum cacheable size), the prefix is sent inline.
+        self._prefix_cache: Optional[caching.CachedContent] = None
+        self._prefix_model: Optional[genai.GenerativeModel] = None
+        self._prefix_cache_failed: bool = not (prefix_cache_ttl and prefix_messages)
+        # The event loop time before which caching is not retried after a
+        # transient error.
+        self._prefix_cache_retry_at: float = 0.0
+        self._prefix_cache_lock: asyncio.Lock = asyncio.Lock()
+        # Cleaned parameter schemas by tool name, with the raw schema they
+        # were derived from.
+        self._schema_cache: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        # The last tool listing seen and its Gemini formatting.
+        self._tools_source: Optional[List[Tool]] = None
+        self._gemini_tools: List[Dict[str, Any]] = []
+        self._generation_config: Optional[genai.types.GenerationConfig] = (
+            genai.types.GenerationConfig(temperature=temperature)
+            if temperature is not None
+            else None
+        )
+        self.model = genai.GenerativeModel(
+            model_name, generation_config=self._generation_config
+        )
+        # Answers to previously seen (history, question) pairs. Like CachedLLM,
+        # they are only reused when the model samples deterministically.
+        self._exact_cache: LRUCache = LRUCache(max_size=EXACT_CACHE_SIZE)
+        self._cache_answers: bool = deterministic(temperature)
+        # Identifies everything besides the history and question that shapes
+        # an answer, so stored answers are not reused for another setup.
+        self._context_key: str = request_key(
+            model=model_name, temperature=temperature, prefix=self._prefix_messages
+        )
+        # Generation configs for server sampling requests, by their parameters.
+        self._sampling_configs: LRUCache = LRUCache(
+            max_size=SAMPLING_CONFIG_CACHE_SIZE
+        )
+        # Answers to similarly phrased questions, if enabled via the environment.
+        self._semantic_cache: Optional[SemanticCache] = SemanticCache.from_env()
+        # Keeps both caches on disk across restarts, if enabled via the environment.
+        self._persistent_cache: Optional[PersistentCache] = PersistentCache.from_env()
+        if self._semantic_cache is not None and self._persistent_cache is not None:
+            self._semantic_cache.load(
+                self._persistent_cache.embeddings(
+                    self._semantic_cache.model_name, self._context_key
+                )
+            )
         # This disables strict response validation, which can help prevent
         # crashes from unrecognized enum values like 'FinishReason: 12'.
         self.model._check_response_type = False
 
+    def close(self) -> None:
+        """
+        Closes the persistent cache, if enabled, writing its pending access
+        times. Later answers are only cached in memory.
+        """
+        persistent_cache, self._persistent_cache = self._persistent_cache, None
+        if persistent_cache is not None:
+            persistent_cache.close()
+
+    async def aclose(self) -> None:
+        """
+        Closes the wrapper like `close`, without blocking the event loop.
+        """
+        await asyncio.to_thread(self.close)
+
     async def sampling_callback(
         self, context: RequestContext, params: CreateMessageRequestParams
     ) -> CreateMessageResult:
         """
         Handles LLM sampling requests originating from a server-side tool.
-        This is passed to the MCPClient during initialization.
+        This is passed to the MCP client or host during initialization.
 
         Args:
             context: The request context, provided by the MCP session.
@@ -84,7 +265,7 @@ class Gemini(Model):
         Returns:
             A CreateMessageResult object containing the model's response.
         """
-        print("--- Server triggered sampling callback ---")
+        logger.debug("Server triggered sampling callback")
         messages = []
         for msg in params.messages:
             role = "model" if msg.role == "assistant" else msg.role
@@ -92,13 +273,9 @@ class Gemini(Model):
                 messages.append({"role": role, "parts": [msg.content.text]})
 
         # Build generation config, respecting sampling params from the server
-        generation_config_args = {"max_output_tokens": params.max_tokens}
-        if params.temperature is not None:
-            generation_config_args["temperature"] = params.temperature
-        if params.top_p is not None:
-            generation_config_args["top_p"] = params.top_p
-
-        generation_config = genai.types.GenerationConfig(**generation_config_args)
+        generation_config = self._sampling_config(
+            params.max_tokens, params.temperature, params.top_p
+        )
 
         # Call the Gemini API with the provided messages and config
         response = await self.model.generate_content_async(
@@ -112,7 +289,39 @@ class Gemini(Model):
             content=TextContent(type="text", text=response.text),
         )
 
-    def ask(self, question: str, messages_history: List[Dict[str, Any]]) -> str:
+    def _sampling_config(
+        self, max_tokens: int, temperature: Optional[float], top_p: Optional[float]
+    ) -> genai.types.GenerationConfig:
+        """
+        Returns the generation config for a set of sampling parameters,
+        reusing the one built for the same parameters before.
+
+        Args:
+            max_tokens: The maximum number of tokens to generate.
+            temperature: An optional sampling temperature.
+            top_p: An optional nucleus sampling probability.
+
+        Returns:
+            The generation config for the parameters.
+        """
+        key = (max_tokens, temperature, top_p)
+        generation_config = self._sampling_configs.get(key)
+        if generation_config is None:
+            generation_config_args: Dict[str, Any] = {"max_output_tokens": max_tokens}
+            if temperature is not None:
+                generation_config_args["temperature"] = temperature
+            if top_p is not None:
+                generation_config_args["top_p"] = top_p
+            generation_config = genai.types.GenerationConfig(**generation_config_args)
+            self._sampling_configs.put(key, generation_config)
+        return generation_config
+
+    async def ask(
+        self,
+        question: str,
+        messages_history: List[Dict[str, Any]],
+        scope: str = DEFAULT_SCOPE,
+    ) -> str:
         """
         Asks a question within a conversation, automatically updating the history
         with a consistent dictionary format.
@@ -125,17 +334,45 @@ class Gemini(Model):
         Args:
             question: The question to ask the model as a simple string.
             messages_history: The conversation history list to use and update.
+            scope: The cache scope of the caller (e.g., an agent or session id).
+                   Cached answers are only shared within the same scope.
+
+        If the model samples deterministically (temperature 0) and the same
+        question was already answered after an identical history, or the
+        semantic cache is enabled and holds a similar enough question, the
+        cached answer is returned without calling the API. The semantic cache
+        applies at any temperature, since enabling it opts into replaying
+        answers to questions that are not even identical.
 
         Returns:
             The model's text response as a string.
         """
+        key = self._answer_key(messages_history, question, scope)
+        cached_text = await self._cached_answer(key)
+
+        embedding = None
+        if (
+            cached_text is None
+            and self._semantic_cache is not None
+            and self._semantic_cache.accepts(question, messages_history)
+        ):
+            try:
+                embedding = await self._semantic_cache.embed_async(question)
+            except Exception as e:
+                # The cache is only an optimization, so ask the model instead.
+                logger.warning("Semantic cache lookup failed: %s", e)
+            else:
+                cached_text = self._semantic_cache.search(embedding, scope)
+
         # Add user's question to the history
-        self.add_message_to_history(
-            messages_history, {"role": "user", "parts": [{"text": question}]}
-        )
+        messages_history.append({"role": "user", "parts": [{"text": question}]})
+
+        if cached_text is not None:
+            messages_history.append({"role": "model", "parts": [{"text": cached_text}]})
+            return cached_text
 
         # Get response from model using the full history
-        response = self.chat(messages_history)
+        response = await self.chat(messages_history)
 
         if response is None:
             messages_history.pop()  # Remove dangling question on API error
@@ -145,23 +382,138 @@ class Gemini(Model):
 
         # If we got a valid text response, add it to history as a dictionary.
         if text:
-            self.add_message_to_history(
-                messages_history, {"role": "model", "parts": [{"text": text}]}
-            )
+            messages_history.append({"role": "model", "parts": [{"text": text}]})
+            self._store_answer(key, text)
+            if embedding is not None:
+                self._semantic_cache.add(embedding, text, scope)
+                if self._persistent_cache is not None:
+                    self._persistent_cache.add_embedding(
+                        self._semantic_cache.model_name,
+                        self._context_key,
+                        scope,
+                        embedding.tobytes(),
+                        text,
+                    )
         # If the response was empty, remove the user's question to keep history clean.
         else:
             messages_history.pop()
 
         return text
 
-    def chat(
+    async def ask_batch(
+        self,
+        questions: List[str],
+        messages_history: List[Dict[str, Any]],
+        scope: str = DEFAULT_SCOPE,
+        max_concurrency: int = 8,
+    ) -> List[str]:
+        """
+        Asks several independent questions after the same conversation history.
+
+        Each distinct question is sent once, as its own request sharing the
+        history prefix, and the requests run concurrently. Unlike `ask`, the
+        history is not updated, since the questions do not follow one another.
+
+        Args:
+            questions: The questions to ask the model.
+            messages_history: The conversation history shared by all questions.
+            scope: The cache scope of the caller, as in `ask`.
+            max_concurrency: The maximum number of requests in flight at once.
+
+        Returns:
+            The model's text responses, in the order of the questions. A failed
+            request yields an empty string.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _ask_one(question: str) -> str:
+            key = self._answer_key(messages_history, question, scope)
+            cached_text = await self._cached_answer(key)
+            if cached_text is not None:
+                return cached_text
+            contents = messages_history + [
+                {"role": "user", "parts": [{"text": question}]}
+            ]
+            async with semaphore:
+                response = await self.chat(contents)
+            text = self.text_from_message(response)
+            if text:
+                self._store_answer(key, text)
+            return text
+
+        # Repeated questions share one request; dict keys keep their order.
+        distinct = list(dict.fromkeys(questions))
+        answers = dict(
+            zip(distinct, await asyncio.gather(*(_ask_one(q) for q in distinct)))
+        )
+        return [answers[question] for question in questions]
+
+    def _answer_key(
+        self, messages_history: List[Dict[str, Any]], question: str, scope: str
+    ) -> str:
+        """
+        Builds the exact-match cache key of a question.
+
+        Args:
+            messages_history: The conversation history preceding the question.
+            question: The question.
+            scope: The cache scope of the caller.
+
+        Returns:
+            The cache key.
+        """
+        return request_key(
+            context=self._context_key,
+            history=messages_history,
+            question=question,
+            scope=scope,
+        )
+
+    async def _cached_answer(self, key: str) -> Optional[str]:
+        """
+        Looks up an answer in memory, then on disk if the persistent cache is
+        enabled. Nothing is looked up unless the model samples
+        deterministically.
+
+        Args:
+            key: The exact-match cache key.
+
+        Returns:
+            The cached answer, or None if there is none.
+        """
+        if not self._cache_answers:
+            return None
+        text = self._exact_cache.get(key)
+        if text is None and self._persistent_cache is not None:
+            text = await self._persistent_cache.get_answer(key)
+            if text is not None:
+                self._exact_cache.put(key, text)
+        return text
+
+    def _store_answer(self, key: str, text: str) -> None:
+        """
+        Stores an answer in memory, and on disk if the persistent cache is
+        enabled, provided the model samples deterministically.
+
+        Args:
+            key: The exact-match cache key.
+            text: The answer to store.
+        """
+        if not self._cache_answers:
+            return
+        self._exact_cache.put(key, text)
+        if self._persistent_cache is not None:
+            self._persistent_cache.put_answer(key, text)
+
+    async def chat(
         self,
         messages: List[Dict[str, Any]],
         tools: Optional[List[Dict[str, Any]]] = None,
     ) -> Optional[GenerateContentResponse]:
         """
         Sends a request to the Gemini API with a conversation history and handles potential server
-        errors.
+        errors. The fixed prefix messages, if any, are sent before the history,
+        and long histories are limited to their most recent turns.
 
         Args:
             messages: A list of message objects representing the conversation history.
@@ -171,24 +523,180 @@ class Gemini(Model):
             A `GenerateContentResponse` object on success, or `None` if a
             server-side error (like a 500 error) occurs.
         """
-        params = {"contents": messages}
-        if tools:
-            params["tools"] = tools
-
         try:
-            return self.model.generate_content(**params)
+            model, prefix = self.model, self._prefix_messages
+            # Gemini does not accept tools alongside cached content, so only
+            # requests without tools use the cached prefix.
+            if not tools:
+                prefix_model = await self._cached_prefix_model()
+                if prefix_model is not None:
+                    model, prefix = prefix_model, []
+            params = {"contents": await self._window(model, prefix, messages, tools)}
+            if tools:
+                params["tools"] = tools
+            return await model.generate_content_async(**params)
         except google_exceptions.InternalServerError:
-            print(
-                "\n🔴 A temporary error occurred on the server (500). Please try your request"
-                "again in a moment."
+            logger.warning(
+                "A temporary error occurred on the server (500). Please try your "
+                "request again in a moment."
             )
             return None
         except Exception as e:
-            print(f"\nAn unexpected error occurred during the API call: {e}")
+            logger.error("An unexpected error occurred during the API call: %s", e)
+            return None
+
+    async def _cached_prefix_model(self) -> Optional[genai.GenerativeModel]:
+        """
+        Returns a model bound to the server-side cache of the prefix messages,
+        creating the cache or extending its lifetime when needed.
+
+        A request that cannot be made (e.g., the prefix is too small) disables
+        caching for good, while other errors only skip it for a while.
+
+        Returns:
+            The model, or None if the prefix is not cached and has to be sent
+            inline.
+        """
+        if self._prefix_cache_failed:
             return None
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._prefix_cache_retry_at:
+            return None
+        now = datetime.datetime.now(datetime.timezone.utc)
+        cache = self._prefix_cache
+        if cache is not None and cache.expire_time - now > PREFIX_CACHE_REFRESH_MARGIN:
+            return self._prefix_model
+
+        async with self._prefix_cache_lock:
+            try:
+                new_cache = await asyncio.to_thread(self._refresh_prefix_cache)
+            except google_exceptions.BadRequest as e:
+                # The prefix cannot be cached at all (e.g., it is below the
+                # minimum cacheable size), so stop trying.
+                logger.warning("Sending prefix messages inline, caching failed: %s", e)
+                self._prefix_cache_failed = True
+                return None
+            except Exception as e:
+                logger.warning(
+                    "Sending prefix messages inline, retrying caching in %ss: %s",
+                    PREFIX_CACHE_RETRY_SECONDS,
+                    e,
+                )
+                self._prefix_cache_retry_at = loop.time() + PREFIX_CACHE_RETRY_SECONDS
+                return None
+            if new_cache is not None:
+                # Both fields are replaced here on the event loop, so the
+                # unlocked check above never pairs a new cache with the model
+                # bound to the old one.
+                prefix_model = genai.GenerativeModel.from_cached_content(
+                    new_cache, generation_config=self._generation_config
+                )
+                prefix_model._check_response_type = False
+                self._prefix_cache, self._prefix_model = new_cache, prefix_model
+            return self._prefix_model
+
+    def _refresh_prefix_cache(self) -> Optional[caching.CachedContent]:
+        """
+        Makes sure the prefix cache exists and is not about to expire, by
+        extending its lifetime or by finding or creating a new one. This runs
+        in a worker thread and leaves the instance's fields to the caller.
+
+        Returns:
+            The cache to use from now on, or None if the current one is kept.
+        """
+        cache = self._prefix_cache
+        if cache is not None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            if cache.expire_time - now > PREFIX_CACHE_REFRESH_MARGIN:
+                # Another request refreshed it while this one was waiting.
+                return None
+            try:
+                cache.update(ttl=self.prefix_cache_ttl)
+                return None
+            except google_exceptions.NotFound:
+                # The cache already expired on the server.
+                pass
+        return self._find_or_create_prefix_cache()
+
+    def _find_or_create_prefix_cache(self) -> caching.CachedContent:
+        """
+        Finds a live server-side cache of the prefix messages, for instance one
+        created by another session, or creates a new one. Caches are matched
+        by a display name derived from the model and the prefix.
+
+        Returns:
+            The cache of the prefix messages.
+        """
+        key = request_key(model=self.model_name, prefix=self._prefix_messages)
+        display_name = f"{PREFIX_CACHE_DISPLAY_NAME}-{key[:32]}"
+        model = self.model_name
+        if "/" not in model:
+            model = f"models/{model}"
+        now = datetime.datetime.now(datetime.timezone.utc)
+        for cache in caching.CachedContent.list(page_size=PREFIX_CACHE_LIST_PAGE_SIZE):
+            if (
+                cache.display_name == display_name
+                and cache.model == model
+                and cache.expire_time - now > PREFIX_CACHE_REFRESH_MARGIN
+            ):
+                return cache
+        return caching.CachedContent.create(
+            model=model,
+            display_name=display_name,
+            contents=self._prefix_messages,
+            ttl=self.prefix_cache_ttl,
+        )
 
+    async def _window(
+        self,
+        model: genai.GenerativeModel,
+        prefix: List[Dict[str, Any]],
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Any]:
+        """
+        Builds the contents of a chat request from the given prefix messages and
+        the most recent turns of the history. The history itself is not modified.
+
+        A turn starts with a user message. Once the history exceeds
+        `max_turns`, the oldest turns are dropped in steps of half the window,
+        so the start of the request only moves every few turns and the
+        provider's prompt cache keeps hitting in between.
+
+        Args:
+            model: The model the request is sent to, used to count tokens.
+            prefix: The prefix messages to send inline, if any.
+            messages: The conversation history.
+            tools: The tools sent with the request, counted against the
+                   token budget.
+
+        Returns:
+            The messages to send to the model.
+        """
+        starts = [i for i, message in enumerate(messages) if _role(message) == "user"]
+        window = messages
+        if self.max_turns is not None and len(starts) > self.max_turns:
+            step = max(1, self.max_turns // 2)
+            drop = -(-(len(starts) - self.max_turns) // step) * step
+            starts = starts[drop:]
+            window = messages[starts[0] :]
+
+        contents = prefix + window if prefix else window
+        if self.max_input_tokens is None:
+            return contents
+
+        # Drop whole turns, oldest first, while the request is over budget.
+        while len(starts) > 1:
+            counted = await model.count_tokens_async(contents, tools=tools)
+            if counted.total_tokens <= self.max_input_tokens:
+                break
+            starts = starts[1:]
+            contents = prefix + messages[starts[0] :]
+        return contents
+
+    @staticmethod
     def add_message_to_history(
-        self, messages: List[Dict[str, Any]], message: Dict[str, Any]
+        messages: List[Dict[str, Any]], message: Dict[str, Any]
     ) -> None:
         """
         Appends a new message to a list representing a conversation history.
@@ -211,53 +719,87 @@ class Gemini(Model):
         """
         if not response:
             return ""
+        # Read the text parts of the first candidate directly; this avoids the
+        # validation in `response.text`, which raises on empty responses. Parts
+        # are joined with newlines, as `response.text` does.
+        candidates = getattr(response, "candidates", None)
+        if candidates:
+            parts = getattr(candidates[0].content, "parts", None) or []
+            return "\n".join(part.text for part in parts if getattr(part, "text", None))
         try:
             return response.text
         except (ValueError, IndexError):
             return ""
 
-    async def get_tools(self, client: MCPClient) -> List[Dict[str, Any]]:
+    async def get_tools(self, client: MCPConnection) -> List[Dict[str, Any]]:
         """
         Fetches tools from the MCP server and formats them for the Gemini API.
 
+        The formatted list is reused as long as the client returns the same
+        cached listing, and cleaned schemas are reused per tool while the raw
+        schema is unchanged, so a typical turn does no schema work at all.
+
         Args:
-            client: The MCPClient instance to fetch tools from.
+            client: The MCP client or host to fetch tools from.
 
         Returns:
             A list of tool definitions formatted for the Gemini API.
         """
-        gemini_tools: List[Dict[str, Any]] = []
         mcp_tools: List[Tool] = await client.list_tools()
+        if mcp_tools is self._tools_source:
+            return self._gemini_tools
+
+        gemini_tools: List[Dict[str, Any]] = []
         for tool in mcp_tools:
-            cleaned_schema = clean_schema(tool.inputSchema) if tool.inputSchema else {}
             gemini_tools.append(
                 {
                     "function_declarations": [
                         {
                             "name": tool.name,
                             "description": tool.description,
-                            "parameters": cleaned_schema,
+                            "parameters": self._clean_tool_schema(tool),
                         }
                     ]
                 }
             )
+        self._tools_source = mcp_tools
+        self._gemini_tools = gemini_tools
         return gemini_tools
 
+    def _clean_tool_schema(self, tool: Tool) -> Dict[str, Any]:
+        """
+        Returns the cleaned input schema of a tool, reusing the cached result
+        if the tool's raw schema has not changed.
+
+        Args:
+            tool: The MCP tool whose schema to clean.
+
+        Returns:
+            The schema cleaned for the Gemini API.
+        """
+        if not tool.inputSchema:
+            return {}
+        cached = self._schema_cache.get(tool.name)
+        if cached is not None and cached[0] == tool.inputSchema:
+            return cached[1]
+        cleaned_schema = clean_schema(tool.inputSchema)
+        self._schema_cache[tool.name] = (tool.inputSchema, cleaned_schema)
+        return cleaned_schema
+
     async def execute_tool_requests(
-        self, client: MCPClient, response: Optional[GenerateContentResponse]
+        self, client: MCPConnection, response: Optional[GenerateContentResponse]
     ) -> List[Dict[str, Any]]:
         """
         Parses tool call requests from a model's response, executes them via the
         MCP client, and formats the results for the next API call.
 
         Args:
-            client: The MCPClient instance to execute tools with.
+            client: The MCP client or host to execute tools with.
             response: The response object from the model, which may contain tool calls.
 
         Returns:
             A list of tool results formatted as `function_response` parts.
         """
-        tool_response_parts: List[Dict[str, Any]] = []
         if not (
             response and response.candidates and response.candidates[0].content.parts
         ):
@@ -268,26 +810,33 @@ class Gemini(Model):
             for p in response.candidates[0].content.parts
             if p.function_call
         ]
-        for call in function_calls:
+        semaphore = asyncio.Semaphore(self.max_tool_concurrency)
+
+        async def _run(call: Any) -> Dict[str, Any]:
             tool_name = call.name
             tool_input = call.args
-            print(f"--- Calling tool: {tool_name} with input: {tool_input} ---")
-            try:
-                tool_output = await client.call_tool(tool_name, tool_input)
-                items = tool_output.content if tool_output else []
-                output_content = json.dumps(
-                    [item.text for item in items if isinstance(item, TextContent)]
-                )
-            except Exception as e:
-                output_content = json.dumps(
-                    {"error": f"Error executing tool '{tool_name}': {e}"}
-                )
-            tool_response_parts.append(
-                {
-                    "function_response": {
-                        "name": tool_name,
-                        "response": {"content": output_content},
-                    }
+            logger.debug("Calling tool: %s with input: %s", tool_name, tool_input)
+            async with semaphore:
+                try:
+                    tool_output = await client.call_tool(tool_name, tool_input)
+                    items = tool_output.content if tool_output else ()
+                    # Tool results are parsed into exact TextContent instances,
+                    # so an identity check on a local name is enough.
+                    text_type = TextContent
+                    output_content = _dumps(
+                        [item.text for item in items if type(item) is text_type]
+                    )
+                except Exception as e:
+                    output_content = _dumps(
+                        {"error": f"Error executing tool '{tool_name}': {e}"}
+                    )
+            return {
+                "function_response": {
+                    "name": tool_name,
+                    "response": {"content": output_content},
                 }
-            )
-        return tool_response_parts
+            }
+
+        # Calls from a single response are independent, so they are sent to
+        # the server concurrently; gather keeps the results in call order.
+        return list(await asyncio.gather(*(_run(call) for call in function_calls)))
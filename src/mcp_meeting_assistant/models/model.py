@@ -11,7 +11,8 @@ from google.generativeai.types import GenerateContentResponse
 from mcp.client.session import RequestContext
 from mcp.types import CreateMessageRequestParams, CreateMessageResult
 
-from mcp_meeting_assistant.mcp_client import MCPClient
+from mcp_meeting_assistant.mcp_host import MCPConnection
+from mcp_meeting_assistant.models.semantic_cache import DEFAULT_SCOPE
 
 
 class Model(ABC):
@@ -26,20 +27,48 @@ class Model(ABC):
         pass
 
     @abstractmethod
-    def ask(self, question: str, messages_history: List[Dict[str, Any]]) -> str:
+    async def ask(
+        self,
+        question: str,
+        messages_history: List[Dict[str, Any]],
+        scope: str = DEFAULT_SCOPE,
+    ) -> str:
+        """
+        Asks a question and appends the question and answer to the history.
+
+        Implementations only ever append to `messages_history`, and callers
+        must not edit or reorder earlier entries: an unchanged prefix lets the
+        provider reuse its prompt cache on the next turn. Fixed instructions
+        belong in the model's prefix messages, and per-turn context (e.g.,
+        retrieved notes) should be added as a new user message instead.
+
+        Cached answers are only reused within the same `scope`, so callers
+        sharing one model (e.g., several agents) should pass distinct scopes.
+        """
+        pass
+
+    @abstractmethod
+    async def ask_batch(
+        self,
+        questions: List[str],
+        messages_history: List[Dict[str, Any]],
+        scope: str = DEFAULT_SCOPE,
+        max_concurrency: int = 8,
+    ) -> List[str]:
         pass
 
     @abstractmethod
-    def chat(
+    async def chat(
         self,
         messages: List[Dict[str, Any]],
         tools: Optional[List[Dict[str, Any]]] = None,
     ) -> Optional[GenerateContentResponse]:
         pass
 
+    @staticmethod
     @abstractmethod
     def add_message_to_history(
-        self, messages: List[Dict[str, Any]], message: Dict[str, Any]
+        messages: List[Dict[str, Any]], message: Dict[str, Any]
     ) -> None:
         pass
 
@@ -48,11 +77,11 @@ class Model(ABC):
         pass
 
     @abstractmethod
-    async def get_tools(self, client: MCPClient) -> List[Dict[str, Any]]:
+    async def get_tools(self, client: MCPConnection) -> List[Dict[str, Any]]:
         pass
 
     @abstractmethod
     async def execute_tool_requests(
-        self, client: MCPClient, response: Optional[GenerateContentResponse]
+        self, client: MCPConnection, response: Optional[GenerateContentResponse]
     ) -> List[Dict[str, Any]]:
         pass
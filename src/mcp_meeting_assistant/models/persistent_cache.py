@@ -0,0 +1,334 @@
+"""
+This module provides a disk-backed store for cached model answers and
+question embeddings, so that the answer caches survive a restart of the
+application.
+
+Entries are kept in a single SQLite database, which is only accessed from a
+dedicated worker thread so that disk I/O never blocks the event loop. Once a
+table grows beyond its entry or size limit, its entries with the oldest
+access time are evicted. The store is enabled by setting
+`PERSISTENT_CACHE_DIR`.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Writes between two checks of the size limits.
+EVICT_CHECK_EVERY = 64
+
+# The share of a table's entries dropped when it exceeds a limit.
+EVICT_FRACTION = 0.1
+
+# The tables of the store, with the expression giving the size of an entry.
+_TABLE_SIZES = {
+    "answers": "LENGTH(key) + LENGTH(text)",
+    "embeddings": (
+        "LENGTH(context) + LENGTH(scope) + LENGTH(embedding) + LENGTH(response)"
+    ),
+}
+
+
+class PersistentCache:
+    """
+    Stores exact-match answers by request key, and question embeddings with
+    their answers by model context and scope, in a SQLite database.
+
+    All database work runs on a single worker thread that owns the
+    connection. Lookups are awaited, while writes are queued to the worker
+    and not waited for.
+
+    Reading an answer refreshes its access time; these refreshes are
+    batched and written together with the next write. Embeddings are loaded
+    once at startup rather than read per lookup, so their access time is the
+    time they were stored. Each table is trimmed back below `max_entries`
+    and `max_bytes` by dropping the entries with the oldest access time,
+    which makes the answers table least recently used first and the
+    embeddings table oldest first.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 10_000,
+        max_bytes: int = 1 << 30,
+    ):
+        """
+        Initializes the PersistentCache, creating the database if needed.
+
+        Args:
+            path: The path of the SQLite database file.
+            max_entries: The maximum number of entries kept in each table.
+            max_bytes: The maximum size of the entries kept in each table.
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened.
+        """
+        self.path: str = path
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self._writes: int = 0
+        # Access times of answers read since the last write, by key.
+        self._touched: Dict[str, float] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        self._executor: concurrent.futures.ThreadPoolExecutor = (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="persistent-cache"
+            )
+        )
+        try:
+            self._executor.submit(self._open).result()
+        except BaseException:
+            self._executor.shutdown()
+            raise
+
+    @classmethod
+    def from_env(cls) -> Optional["PersistentCache"]:
+        """
+        Creates a store in the directory given by `PERSISTENT_CACHE_DIR`.
+
+        Returns:
+            A PersistentCache, or None if the variable is not set or the
+            database cannot be opened.
+        """
+        directory = os.getenv("PERSISTENT_CACHE_DIR")
+        if not directory:
+            return None
+        directory = os.path.expanduser(directory)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            return cls(os.path.join(directory, "cache.sqlite3"))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                "Persistent cache disabled, could not open %s: %s", directory, e
+            )
+            return None
+
+    async def get_answer(self, key: str) -> Optional[str]:
+        """
+        Returns the stored answer for a request key.
+
+        Args:
+            key: The request key, as built by `request_key`.
+
+        Returns:
+            The stored answer, or None if there is none or it cannot be read.
+        """
+        try:
+            return await self._run(self._get_answer, key)
+        except sqlite3.Error as e:
+            # A failed read is treated as a miss, like failed writes are ignored.
+            logger.warning("Persistent cache read failed: %s", e)
+            return None
+
+    def put_answer(self, key: str, text: str) -> None:
+        """
+        Queues the answer for a request key to be stored.
+
+        Args:
+            key: The request key, as built by `request_key`.
+            text: The answer to store.
+        """
+        self._submit(self._put_answer, key, text)
+
+    def embeddings(self, model: str, context: str) -> List[Tuple[str, bytes, str]]:
+        """
+        Returns the embeddings stored for an embedding model and a model
+        context, oldest first. This blocks until they are read and is meant to
+        be called at startup.
+
+        Args:
+            model: The name of the embedding model.
+            context: The key of the LLM setup (model, temperature and prefix)
+                     that produced the answers.
+
+        Returns:
+            Tuples of scope, raw float32 embedding bytes and answer, or an empty
+            list if they cannot be read.
+        """
+        try:
+            return self._executor.submit(self._embeddings, model, context).result()
+        except sqlite3.Error as e:
+            logger.warning("Persistent cache read failed: %s", e)
+            return []
+
+    def add_embedding(
+        self, model: str, context: str, scope: str, embedding: bytes, response: str
+    ) -> None:
+        """
+        Queues a question embedding and its answer to be stored.
+
+        Args:
+            model: The name of the embedding model that produced the embedding.
+            context: The key of the LLM setup that produced the answer.
+            scope: The cache scope of the entry.
+            embedding: The raw float32 bytes of the normalized embedding.
+            response: The answer to the question.
+        """
+        self._submit(self._add_embedding, model, context, scope, embedding, response)
+
+    def close(self) -> None:
+        """
+        Writes pending access times, closes the database and stops the worker.
+        """
+        self._executor.submit(self._close)
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Runs a function on the worker thread and waits for its result.
+        """
+        return await asyncio.wrap_future(self._executor.submit(func, *args))
+
+    def _submit(self, func: Callable[..., Any], *args: Any) -> None:
+        """
+        Queues a function on the worker thread without waiting for it.
+        Failures are logged, since no caller is there to receive them.
+        """
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(_log_failure)
+
+    # The methods below run on the worker thread only.
+
+    def _open(self) -> None:
+        """
+        Opens the database and creates its tables if needed.
+        """
+        self._db = sqlite3.connect(self.path)
+        # Write-ahead logging avoids a full sync of the database on every write.
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS answers "
+            "(key TEXT PRIMARY KEY, text TEXT NOT NULL, atime REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(id INTEGER PRIMARY KEY, model TEXT NOT NULL, "
+            "context TEXT NOT NULL DEFAULT '', scope TEXT NOT NULL, "
+            "embedding BLOB NOT NULL, response TEXT NOT NULL, atime REAL NOT NULL)"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(embeddings)")}
+        if "context" not in columns:
+            # Entries from before the context was stored match no context and
+            # are evicted over time.
+            self._db.execute(
+                "ALTER TABLE embeddings ADD COLUMN context TEXT NOT NULL DEFAULT ''"
+            )
+        self._db.commit()
+        self._evict()
+
+    def _get_answer(self, key: str) -> Optional[str]:
+        """
+        Reads an answer and records its access time for the next write.
+        """
+        row = self._db.execute(
+            "SELECT text FROM answers WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._touched[key] = time.time()
+        return row[0]
+
+    def _put_answer(self, key: str, text: str) -> None:
+        """
+        Writes an answer.
+        """
+        self._touched.pop(key, None)
+        self._db.execute(
+            "INSERT OR REPLACE INTO answers (key, text, atime) VALUES (?, ?, ?)",
+            (key, text, time.time()),
+        )
+        self._committed_write()
+
+    def _embeddings(self, model: str, context: str) -> List[Tuple[str, bytes, str]]:
+        """
+        Reads the embeddings of an embedding model and a model context.
+        """
+        return self._db.execute(
+            "SELECT scope, embedding, response FROM embeddings "
+            "WHERE model = ? AND context = ? ORDER BY id",
+            (model, context),
+        ).fetchall()
+
+    def _add_embedding(
+        self, model: str, context: str, scope: str, embedding: bytes, response: str
+    ) -> None:
+        """
+        Writes an embedding and its answer.
+        """
+        self._db.execute(
+            "INSERT INTO embeddings "
+            "(model, context, scope, embedding, response, atime) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (model, context, scope, embedding, response, time.time()),
+        )
+        self._committed_write()
+
+    def _write_touches(self) -> None:
+        """
+        Writes the access times of the answers read since the last write.
+        """
+        if self._touched:
+            self._db.executemany(
+                "UPDATE answers SET atime = ? WHERE key = ?",
+                [(atime, key) for key, atime in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _committed_write(self) -> None:
+        """
+        Commits a write together with pending access times, and periodically
+        enforces the size limits.
+        """
+        self._write_touches()
+        self._db.commit()
+        self._writes += 1
+        if self._writes >= EVICT_CHECK_EVERY:
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Drops the entries with the oldest access time from each table that is
+        over a limit, until it is back within its limits.
+        """
+        self._writes = 0
+        for table, size in _TABLE_SIZES.items():
+            while True:
+                count, total = self._db.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM({size}), 0) FROM {table}"
+                ).fetchone()
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                excess = max(count - self.max_entries, int(count * EVICT_FRACTION), 1)
+                self._db.execute(
+                    f"DELETE FROM {table} WHERE rowid IN "
+                    f"(SELECT rowid FROM {table} ORDER BY atime LIMIT ?)",
+                    (excess,),
+                )
+        self._db.commit()
+
+    def _close(self) -> None:
+        """
+        Writes pending access times and closes the database.
+        """
+        self._write_touches()
+        self._db.commit()
+        self._db.close()
+
+
+def _log_failure(future: "concurrent.futures.Future[Any]") -> None:
+    """
+    Logs the exception of a queued store write, if it failed.
+    """
+    error = future.exception()
+    if error is not None:
+        logger.warning("Persistent cache write failed: %s", error)
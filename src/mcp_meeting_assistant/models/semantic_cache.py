@@ -0,0 +1,400 @@
+"""
+This module provides a semantic cache for model answers. Questions are
+embedded with a small local sentence-embedding model, and a new question is
+answered from the cache when it is similar enough to one answered before,
+even if it is phrased differently.
+
+The cache needs the optional `numpy` and `sentence-transformers` packages
+(`pip install .[semantic]`) and is enabled with `SEMANTIC_CACHE_ENABLED=1`.
+If `faiss` is installed as well, large scopes are searched with a FAISS index.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Questions that differ only by a number embed almost identically, so
+# questions containing digits are never answered from the cache.
+_DIGIT_RE = re.compile(r"\d")
+
+# The scope used when a caller does not partition the cache.
+DEFAULT_SCOPE = "default"
+
+# How long the first question of a batch waits for others to embed with it.
+EMBED_BATCH_WINDOW_SECONDS = 0.005
+
+# The maximum number of questions embedded in one encoder call.
+EMBED_BATCH_SIZE = 32
+
+# The number of rows a scope's embedding matrix is first allocated with.
+INITIAL_CAPACITY = 64
+
+# The number of float16 rows cast to float32 at a time during a search, which
+# bounds the temporary memory of a lookup.
+SEARCH_CHUNK_ROWS = 4096
+
+# The number of entries from which a scope is searched with FAISS, if available.
+FAISS_MIN_ENTRIES = 10_000
+
+
+class EmbeddingCache:
+    """
+    A bounded mapping from question text to its embedding, keyed by a hash
+    of the text. Once full, the oldest entry is evicted.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initializes the EmbeddingCache.
+
+        Args:
+            max_size: The maximum number of embeddings to keep.
+        """
+        self.max_size: int = max_size
+        self._data: Dict[bytes, Any] = {}
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """
+        Returns the cache key of a text.
+
+        Args:
+            text: The text to hash.
+
+        Returns:
+            A digest identifying the text.
+        """
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def get(self, text: str) -> Optional[Any]:
+        """
+        Returns the cached embedding of a text.
+
+        Args:
+            text: The text to look up.
+
+        Returns:
+            The embedding, or None if the text has not been embedded yet.
+        """
+        return self._data.get(self.key(text))
+
+    def put(self, text: str, embedding: Any) -> None:
+        """
+        Stores the embedding of a text, evicting the oldest entry if full.
+
+        Args:
+            text: The embedded text.
+            embedding: Its embedding.
+        """
+        self._data[self.key(text)] = embedding
+        if len(self._data) > self.max_size:
+            del self._data[next(iter(self._data))]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@dataclass(slots=True)
+class _ScopeIndex:
+    """
+    The stored embeddings and answers of a single cache scope.
+
+    Embeddings are stored as float16 rows of a preallocated matrix, of which
+    the first `size` rows are in use.
+    """
+
+    matrix: Optional[Any] = None
+    size: int = 0
+    responses: List[str] = field(default_factory=list)
+    # A FAISS index over the first `indexed` rows, once the scope is large.
+    faiss_index: Optional[Any] = None
+    indexed: int = 0
+
+
+class SemanticCache:
+    """
+    Stores (question embedding, answer) pairs and looks up the answer of the
+    most similar stored question by cosine similarity.
+
+    Questions are embedded once and remembered, and questions that arrive at
+    nearly the same time are embedded together in one encoder call, off the
+    event loop.
+
+    Entries are partitioned by scope (e.g., an agent or session id), and a
+    lookup only considers entries of its own scope, so one agent is never
+    served another agent's answer. Within a scope, embeddings are kept
+    normalized in a single float16 matrix, which halves the memory read by a
+    lookup; rows are cast to float32 in chunks for the matrix-vector product.
+    The matrix is preallocated and doubled when full, so inserts do not copy
+    it. Scopes with many entries are searched with a FAISS inner-product
+    index instead, if `faiss` is installed.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        threshold: float = 0.92,
+        history_msg_threshold: int = 8,
+        encoder: Optional[Any] = None,
+    ):
+        """
+        Initializes the SemanticCache.
+
+        Args:
+            model_name: The sentence-transformers model used to embed questions.
+            threshold: The minimum cosine similarity for a cached answer to be used.
+            history_msg_threshold: Lookups are skipped once the conversation
+                                   history has more messages than this.
+            encoder: An optional object with an `encode` method to use instead
+                     of loading `model_name`.
+
+        Raises:
+            ImportError: If the optional dependencies are not installed.
+        """
+        import numpy as np
+
+        if encoder is None:
+            from sentence_transformers import SentenceTransformer
+
+            encoder = SentenceTransformer(model_name)
+
+        try:
+            import faiss
+        except ImportError:
+            faiss = None
+
+        self._np = np
+        self._faiss: Optional[Any] = faiss
+        self._encoder = encoder
+        self.model_name: str = model_name
+        self.threshold: float = threshold
+        self.history_msg_threshold: int = history_msg_threshold
+        self._scopes: Dict[str, _ScopeIndex] = {}
+        self._embeddings: EmbeddingCache = EmbeddingCache()
+        # Questions waiting to be embedded in the next batch.
+        self._batch: Optional[Dict[str, asyncio.Future]] = None
+        # Running batch tasks, referenced so they are not garbage collected.
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_env(cls) -> Optional["SemanticCache"]:
+        """
+        Creates a cache configured from environment variables, if enabled.
+
+        Reads `SEMANTIC_CACHE_ENABLED`, `SEMANTIC_CACHE_MODEL`,
+        `SEMANTIC_CACHE_THRESHOLD` and `SEMANTIC_CACHE_HISTORY_THRESHOLD`.
+
+        Returns:
+            A SemanticCache, or None if the cache is disabled or its optional
+            dependencies are missing.
+        """
+        if os.getenv("SEMANTIC_CACHE_ENABLED", "").lower() not in ("1", "true", "yes"):
+            return None
+
+        kwargs: Dict[str, Any] = {
+            "model_name": os.getenv("SEMANTIC_CACHE_MODEL", DEFAULT_EMBEDDING_MODEL)
+        }
+        if os.getenv("SEMANTIC_CACHE_THRESHOLD"):
+            kwargs["threshold"] = float(os.environ["SEMANTIC_CACHE_THRESHOLD"])
+        if os.getenv("SEMANTIC_CACHE_HISTORY_THRESHOLD"):
+            kwargs["history_msg_threshold"] = int(
+                os.environ["SEMANTIC_CACHE_HISTORY_THRESHOLD"]
+            )
+        try:
+            return cls(**kwargs)
+        except ImportError as e:
+            logger.warning(
+                "Semantic cache disabled, missing optional dependency: %s", e
+            )
+            return None
+
+    def accepts(self, question: str, messages_history: List[Dict[str, Any]]) -> bool:
+        """
+        Whether a lookup is worthwhile for a question asked after the given
+        history. Long conversations rarely repeat and are prone to false hits,
+        and questions with numbers in them are too easily confused.
+
+        Args:
+            question: The question about to be asked.
+            messages_history: The conversation history preceding the question.
+
+        Returns:
+            True if the cache should be consulted.
+        """
+        if len(messages_history) > self.history_msg_threshold:
+            return False
+        return _DIGIT_RE.search(question) is None
+
+    async def embed_async(self, text: str) -> Any:
+        """
+        Embeds a text into a normalized float32 vector, without blocking the
+        event loop.
+
+        Texts requested within a few milliseconds of each other are encoded
+        together in a worker thread, which is much faster per text than
+        encoding them one by one.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            The embedding as a 1-D numpy array.
+        """
+        embedding = self._embeddings.get(text)
+        if embedding is not None:
+            return embedding
+
+        loop = asyncio.get_running_loop()
+        if self._batch is None:
+            self._batch = {}
+            loop.call_later(EMBED_BATCH_WINDOW_SECONDS, self._start_batch)
+        future = self._batch.get(text)
+        if future is None:
+            future = self._batch[text] = loop.create_future()
+            if len(self._batch) >= EMBED_BATCH_SIZE:
+                self._start_batch()
+        return await asyncio.shield(future)
+
+    def _start_batch(self) -> None:
+        """
+        Starts encoding the texts collected so far, if any.
+        """
+        batch, self._batch = self._batch, None
+        if not batch:
+            return
+        task = asyncio.create_task(self._encode_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _encode_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        """
+        Encodes a batch of texts in a worker thread and resolves their futures.
+
+        Args:
+            batch: The texts to encode, with the futures awaiting them.
+        """
+        texts = list(batch)
+        try:
+            embeddings = await asyncio.to_thread(self._encode, texts)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for text, embedding in zip(texts, embeddings):
+            self._embeddings.put(text, embedding)
+            future = batch[text]
+            if not future.done():
+                future.set_result(embedding)
+
+    def _encode(self, texts: List[str]) -> Any:
+        """
+        Encodes texts into normalized float32 vectors with one encoder call.
+
+        Args:
+            texts: The texts to encode.
+
+        Returns:
+            A 2-D numpy array with one row per text.
+        """
+        vectors = self._np.asarray(self._encoder.encode(texts), dtype=self._np.float32)
+        norms = self._np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return vectors / norms
+
+    def search(self, embedding: Any, scope: str = DEFAULT_SCOPE) -> Optional[str]:
+        """
+        Finds the answer of the most similar stored question in a scope.
+
+        Args:
+            embedding: The normalized embedding of the new question.
+            scope: The scope to search in.
+
+        Returns:
+            The cached answer, or None if no stored question is similar enough.
+        """
+        index = self._scopes.get(scope)
+        if index is None or not index.size:
+            return None
+        np = self._np
+        query = np.asarray(embedding, dtype=np.float32)
+
+        if self._faiss is not None and index.size >= FAISS_MIN_ENTRIES:
+            best, score = self._search_faiss(index, query)
+        else:
+            best, score = -1, -np.inf
+            for start in range(0, index.size, SEARCH_CHUNK_ROWS):
+                stop = min(start + SEARCH_CHUNK_ROWS, index.size)
+                similarities = index.matrix[start:stop].astype(np.float32) @ query
+                row = int(similarities.argmax())
+                if similarities[row] > score:
+                    best, score = start + row, float(similarities[row])
+
+        if score >= self.threshold:
+            return index.responses[best]
+        return None
+
+    def _search_faiss(self, index: _ScopeIndex, query: Any) -> Tuple[int, float]:
+        """
+        Searches a scope with its FAISS index, first adding the rows stored
+        since the last search.
+
+        Args:
+            index: The scope to search.
+            query: The float32 embedding of the new question.
+
+        Returns:
+            The row of the most similar entry and its similarity.
+        """
+        if index.faiss_index is None:
+            index.faiss_index = self._faiss.IndexFlatIP(index.matrix.shape[1])
+        if index.indexed < index.size:
+            rows = index.matrix[index.indexed : index.size].astype(self._np.float32)
+            index.faiss_index.add(rows)
+            index.indexed = index.size
+        scores, rows = index.faiss_index.search(query[None, :], 1)
+        return int(rows[0, 0]), float(scores[0, 0])
+
+    def add(self, embedding: Any, response: str, scope: str = DEFAULT_SCOPE) -> None:
+        """
+        Stores an answer under the embedding of its question.
+
+        Args:
+            embedding: The normalized embedding of the question.
+            response: The answer to cache.
+            scope: The scope to store the answer in.
+        """
+        np = self._np
+        index = self._scopes.setdefault(scope, _ScopeIndex())
+        if index.matrix is None:
+            index.matrix = np.empty(
+                (INITIAL_CAPACITY, len(embedding)), dtype=np.float16
+            )
+        elif index.size == len(index.matrix):
+            grown = np.empty(
+                (2 * len(index.matrix), index.matrix.shape[1]), dtype=np.float16
+            )
+            grown[: index.size] = index.matrix
+            index.matrix = grown
+        index.matrix[index.size] = embedding
+        index.size += 1
+        index.responses.append(response)
+
+    def load(self, entries: Iterable[Tuple[str, bytes, str]]) -> None:
+        """
+        Adds previously stored entries, e.g., from a persistent cache.
+
+        Args:
+            entries: Tuples of scope, raw float32 embedding bytes and answer.
+        """
+        for scope, embedding, response in entries:
+            vector = self._np.frombuffer(embedding, dtype=self._np.float32)
+            self.add(vector, response, scope)
@@ -0,0 +1,213 @@
+"""
+This module provides a synchronous wrapper around MCPClient for callers that
+do not run an asyncio event loop themselves, such as threaded agent
+frameworks. All calls are dispatched to a single background event loop, so
+the connection is kept open between calls instead of being re-created by a
+fresh `asyncio.run()` each time.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+from typing import Any, Callable, Coroutine, Dict, List, Optional, TypeVar
+
+from mcp.types import CallToolResult, Tool
+
+from mcp_meeting_assistant.mcp_client import MCPClient
+
+T = TypeVar("T")
+
+
+class AsyncLoopThread(threading.Thread):
+    """
+    A daemon thread that runs its own asyncio event loop until stopped.
+    """
+
+    def __init__(self):
+        """
+        Initializes the thread and creates its event loop.
+        """
+        super().__init__(name="mcp-event-loop", daemon=True)
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+
+    def run(self) -> None:
+        """
+        Runs the event loop until `stop` is called.
+        """
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedules a coroutine on the thread's event loop.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            A future that resolves to the coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        """
+        Stops the event loop and waits for the thread to finish.
+        """
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join()
+        self.loop.close()
+
+
+class MCPClientWrapper:
+    """
+    A synchronous facade for MCPClient.
+
+    The wrapped client lives on a background event loop, and each method
+    blocks the calling thread until the corresponding coroutine completes.
+    It can be shared by several threads and is designed to be used as a
+    context manager, or via explicit `connect()` and `close()` calls.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        args: List[str],
+        env: Optional[Dict[str, str]] = None,
+        sampling_callback: Optional[
+            Callable[[Any, Any], Coroutine[Any, Any, Any]]
+        ] = None,
+        loop_thread: Optional[AsyncLoopThread] = None,
+    ):
+        """
+        Initializes the MCPClientWrapper.
+
+        Args:
+            command: The command to execute the server (e.g., 'python').
+            args: A list of arguments for the command (e.g., ['path/to/server.py']).
+            env: An optional dictionary of environment variables for the server process.
+            sampling_callback: An async function to handle LLM calls from the server.
+                               It runs on the background event loop.
+            loop_thread: An optional event loop thread to share with other
+                         wrappers. If omitted, the wrapper starts and owns one.
+        """
+        self._client_factory: Callable[[], MCPClient] = functools.partial(
+            MCPClient,
+            command=command,
+            args=args,
+            env=env,
+            sampling_callback=sampling_callback,
+        )
+        self._client: MCPClient = self._client_factory()
+        self._owns_loop_thread: bool = loop_thread is None
+        self._loop_thread: AsyncLoopThread = loop_thread or AsyncLoopThread()
+        self._closing: Optional[asyncio.Event] = None
+        self._lifecycle: Optional[concurrent.futures.Future] = None
+
+    def connect(self) -> None:
+        """
+        Starts the server process and connects to it on the background loop.
+        Calling this on an already connected wrapper is a no-op, and a closed
+        wrapper can be connected again.
+        """
+        if self._lifecycle is not None:
+            return
+        if self._loop_thread.loop.is_closed():
+            if not self._owns_loop_thread:
+                raise RuntimeError("The shared event loop thread has been stopped.")
+            # The previous loop was stopped by `close()`; the client and its
+            # locks are bound to it, so both are replaced.
+            self._loop_thread = AsyncLoopThread()
+            self._client = self._client_factory()
+        if not self._loop_thread.is_alive():
+            self._loop_thread.start()
+
+        connected: concurrent.futures.Future = concurrent.futures.Future()
+        self._closing = asyncio.Event()
+        self._lifecycle = self._loop_thread.submit(
+            self._client.serve_until(self._closing, connected)
+        )
+        try:
+            connected.result()
+        except BaseException:
+            self._lifecycle = None
+            raise
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Runs a coroutine on the background loop and waits for its result.
+        """
+        return self._loop_thread.submit(coro).result()
+
+    def list_tools_sync(self) -> List[Tool]:
+        """
+        Fetches the list of available tools from the MCP server.
+
+        Returns:
+            A list of Tool objects.
+        """
+        return self._run(self._client.list_tools())
+
+    def call_tool_sync(
+        self, tool_name: str, tool_input: Dict[str, Any]
+    ) -> CallToolResult:
+        """
+        Calls a specific tool on the MCP server with the given input.
+
+        Args:
+            tool_name: The name of the tool to call.
+            tool_input: A dictionary of arguments for the tool.
+
+        Returns:
+            The response from the tool call.
+        """
+        return self._run(self._client.call_tool(tool_name, tool_input))
+
+    def list_prompts_sync(self) -> List[str]:
+        """
+        Lists all available prompts on the MCP server.
+
+        Returns:
+            A list of prompt names.
+        """
+        return self._run(self._client.list_prompts())
+
+    def run_prompt_sync(
+        self, name: str, arguments: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Gets a prompt from the server and returns its raw text content.
+
+        Args:
+            name: The name of the prompt to run.
+            arguments: An optional dictionary of arguments for the prompt.
+
+        Returns:
+            The raw text content of the prompt, or None if the prompt is empty.
+        """
+        return self._run(self._client.run_prompt(name, arguments))
+
+    def close(self) -> None:
+        """
+        Disconnects from the server and stops the background loop if the
+        wrapper owns it.
+        """
+        if self._lifecycle is not None:
+            self._loop_thread.loop.call_soon_threadsafe(self._closing.set)
+            self._lifecycle.result()
+            self._lifecycle = None
+        if self._owns_loop_thread and self._loop_thread.is_alive():
+            self._loop_thread.stop()
+
+    def __enter__(self) -> "MCPClientWrapper":
+        """
+        Enters the context, connecting to the server.
+        """
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """
+        Exits the context, closing the connection.
+        """
+        self.close()